@@ -199,6 +199,17 @@ class FractalConnector:
         await self.stop()
 
 
+def install_event_loop_policy():
+    """Use uvloop's libuv-based event loop when it is available."""
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -244,6 +255,8 @@ def main():
         ui_port=args.port,
     )
 
+    install_event_loop_policy()
+
     try:
         asyncio.run(connector.run_forever())
     except KeyboardInterrupt:
@@ -1,10 +1,12 @@
 """Main connector engine that orchestrates data sources and Fractal communication."""
 import asyncio
+import contextlib
 import logging
 from typing import Any, Optional, Type
 
 from .config import ConfigManager, DataSourceConfig
 from .websocket_client import FractalClient
+from ..plugins._http import close_session
 from ..plugins.base import DataSourcePlugin, DataRecord
 
 logger = logging.getLogger(__name__)
@@ -119,6 +121,9 @@ class ConnectorEngine:
             except Exception as e:
                 logger.error(f"Error disconnecting plugin {plugin.source_id}: {e}")
 
+        # Close the HTTP connection pool shared by the plugins
+        await close_session()
+
         # Disconnect from Fractal
         if self._fractal_client:
             await self._fractal_client.stop()
@@ -178,9 +183,17 @@ class ConnectorEngine:
         if not plugin:
             return
 
+        # Nothing to deliver to, so don't drain the source for nothing
+        if not (self._fractal_client and self._fractal_client.is_connected):
+            return
+
         try:
-            async for record in plugin.fetch_data():
-                if self._fractal_client and self._fractal_client.is_connected:
+            # Records are sent as they arrive; aclosing() stops the plugin's
+            # downloads right away if the sync ends early
+            async with contextlib.aclosing(plugin.fetch_data()) as records:
+                async for record in records:
+                    if not self._fractal_client.is_connected:
+                        break
                     await self._fractal_client.send_data(
                         source_id=record.source_id,
                         source_type=record.source_type,
@@ -227,8 +240,9 @@ class ConnectorEngine:
         )
 
         # Test connection first
-        test_plugin = plugin_class(source_id=source_id, credentials=credentials)
-        success, message = await test_plugin.test_connection()
+        success, message = await asyncio.to_thread(
+            self._run_connection_test, plugin_class, source_id, credentials
+        )
 
         if not success:
             return False, f"Connection test failed: {message}"
@@ -268,8 +282,28 @@ class ConnectorEngine:
         if not valid:
             return False, error
 
-        plugin = plugin_class(source_id="test", credentials=credentials)
-        return await plugin.test_connection()
+        return await asyncio.to_thread(self._run_connection_test, plugin_class, "test", credentials)
+
+    @staticmethod
+    def _run_connection_test(
+        plugin_class: Type[DataSourcePlugin], source_id: str, credentials: dict[str, Any]
+    ) -> tuple[bool, str]:
+        """
+        Run a plugin's connection test on a private event loop.
+
+        Called in a worker thread: many plugins block inside connect/test
+        (database drivers, ftplib, boto3), which must not stall the syncs
+        running on the engine loop.
+        """
+        async def probe():
+            plugin = plugin_class(source_id=source_id, credentials=credentials)
+            try:
+                return await plugin.test_connection()
+            finally:
+                await plugin.disconnect()
+                await close_session()
+
+        return asyncio.run(probe())
 
     def get_status(self) -> dict[str, Any]:
         """Get current engine status."""
@@ -1,9 +1,14 @@
 """Production logging configuration."""
+import atexit
 import logging
 import os
 from pathlib import Path
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from datetime import datetime
+from queue import SimpleQueue
+
+# Background thread that writes queued log records to the real handlers
+_listener: QueueListener | None = None
 
 
 def setup_logging(
@@ -23,6 +28,8 @@ def setup_logging(
         backup_count: Number of backup files to keep
         console: Whether to also log to console
     """
+    global _listener
+
     # Determine log directory
     if log_dir is None:
         if os.name == 'nt':  # Windows
@@ -46,6 +53,11 @@ def setup_logging(
 
     # Clear existing handlers
     root_logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    handlers = []
 
     # Main log file with rotation by size
     main_log_file = log_dir / 'fractal-connector.log'
@@ -57,7 +69,7 @@ def setup_logging(
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
     # Error log file (errors only)
     error_log_file = log_dir / 'errors.log'
@@ -69,14 +81,21 @@ def setup_logging(
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
 
     # Console handler
     if console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(simple_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # File and console writes happen on a listener thread so logging from
+    # the asyncio event loop never blocks on disk or stdout
+    log_queue = SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Log startup
     logger = logging.getLogger(__name__)
@@ -85,6 +104,13 @@ def setup_logging(
     return root_logger
 
 
+@atexit.register
+def _stop_listener():
+    """Flush queued log records on interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
 def get_log_dir() -> Path:
     """Get the log directory path."""
     if os.name == 'nt':
@@ -0,0 +1,74 @@
+"""Shared CSV parsing for file-based plugins."""
+from typing import Any, Iterator
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _isoformat_column(column):
+    """Render a date, time or timestamp column as the Python values' isoformat() strings."""
+    if pa.types.is_timestamp(column.type):
+        column = column.cast(pa.timestamp("us", column.type.tz), safe=False)
+    elif pa.types.is_time(column.type):
+        column = column.cast(pa.time64("us"), safe=False)
+    return pa.array([None if v is None else v.isoformat() for v in column.to_pylist()], pa.string())
+
+
+def _json_ready(column):
+    """Cast an Arrow column whose Python values aren't JSON-serializable."""
+    if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type) or pa.types.is_time(column.type):
+        return _isoformat_column(column)
+    if pa.types.is_temporal(column.type):
+        return column.cast(pa.string())
+    if pa.types.is_decimal(column.type):
+        return column.cast(pa.float64())
+    return column
+
+
+def arrow_rows(batch) -> list[dict[str, Any]]:
+    """Convert an Arrow record batch or table to row dicts of JSON-ready values."""
+    columns = [_json_ready(column) for column in batch.columns]
+    return pa.Table.from_arrays(columns, names=batch.schema.names).to_pylist()
+
+
+def parse_columns(value: str | None) -> list[str] | None:
+    """Parse a comma-separated column list credential, None meaning all columns."""
+    columns = [c.strip() for c in (value or "").split(",") if c.strip()]
+    return columns or None
+
+
+def read_excel_rows(source, columns: list[str] | None = None) -> list[dict[str, Any]]:
+    """Parse an Excel workbook's first sheet from a seekable file object into row dicts."""
+    return pd.read_excel(source, usecols=columns).to_dict(orient='records')
+
+
+def read_csv(source, delimiter: str = ",", columns: list[str] | None = None) -> pd.DataFrame:
+    """Read a whole CSV file object into a DataFrame, restricted to columns if given."""
+    return pd.read_csv(source, delimiter=delimiter, usecols=columns)
+
+
+def frame_rows(df: pd.DataFrame, chunksize: int = 10_000) -> Iterator[list[dict[str, Any]]]:
+    """Yield a DataFrame's rows as lists of at most chunksize row dicts."""
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize].to_dict(orient='records')
+
+
+def iter_csv_rows(
+    source,
+    delimiter: str = ",",
+    chunksize: int = 10_000,
+    columns: list[str] | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Parse a CSV file object, yielding lists of row dicts.
+
+    pandas infers column types from the whole file, so values come out
+    exactly as pd.read_csv(...).to_dict('records') gives them; only the
+    conversion to dicts is done chunksize rows at a time. If columns is
+    given, only those columns are parsed and returned.
+    """
+    yield from frame_rows(read_csv(source, delimiter, columns), chunksize)
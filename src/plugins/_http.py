@@ -0,0 +1,71 @@
+"""Shared aiohttp session for HTTP-based plugins."""
+import asyncio
+import weakref
+from typing import Any
+
+import aiohttp
+import orjson
+from aiohttp.abc import AbstractResolver
+
+# One pooled session per event loop. aiohttp sessions are bound to the loop
+# they were created on, so plugins running on different loops (e.g. the UI
+# thread) each get their own pool.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def _create_resolver() -> AbstractResolver:
+    """Use aiodns when installed so lookups don't block on getaddrinfo."""
+    try:
+        import aiodns  # noqa: F401
+        return aiohttp.AsyncResolver()
+    except ImportError:
+        return aiohttp.ThreadedResolver()
+    except RuntimeError:
+        # aiodns before 3.2 refuses to run on Windows' default Proactor loop
+        return aiohttp.ThreadedResolver()
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create a session with a tuned connection pool and DNS cache."""
+    connector = aiohttp.TCPConnector(
+        resolver=_create_resolver(),
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        # No overall cap: downloads and streamed bodies may legitimately take
+        # minutes. Stalls are caught per socket operation instead, and
+        # callers can pass their own timeout for a per-request total.
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60),
+    )
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide HTTP session for the running event loop.
+
+    Plugins must not close the returned session; it is shared by every
+    plugin instance and closed via close_session() on shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = _create_session()
+        _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """Close the shared HTTP session for the running event loop."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session and not session.closed:
+        await session.close()
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body with orjson rather than the stdlib parser."""
+    return orjson.loads(await response.read())
@@ -0,0 +1,197 @@
+"""Retry, circuit breaker and bulkhead helpers for plugin HTTP calls."""
+import asyncio
+import contextlib
+import random
+import time
+import weakref
+from collections import deque
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# Responses worth retrying; anything else (notably 401/403) is returned as-is
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Maximum concurrent in-flight requests per host
+BULKHEAD_SIZE = 32
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because its host's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    The breaker starts CLOSED. After failure_threshold failures within window
+    seconds it goes OPEN and rejects requests for reset_timeout seconds. It
+    then goes HALF_OPEN and lets a single trial request through: success
+    closes the circuit again, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, window: float = 30.0, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self._failures: deque[float] = deque()
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current breaker state."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, claiming the trial slot if half-open."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def cancel_trial(self):
+        """Give up a claimed half-open trial slot without recording a result."""
+        self._trial_in_flight = False
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        self._failures.clear()
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if the threshold is hit."""
+        now = time.monotonic()
+
+        if self._trial_in_flight:
+            # Half-open trial failed: back to open for another reset period
+            self._trial_in_flight = False
+            self._opened_at = now
+            return
+
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+
+        if len(self._failures) >= self.failure_threshold:
+            self._opened_at = now
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+# Semaphores are bound to the event loop they are first used on, so bulkheads
+# are kept per loop
+_bulkheads: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Get the circuit breaker for a host."""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker()
+    return breaker
+
+
+def _get_bulkhead(host: str) -> asyncio.Semaphore:
+    """Get the bulkhead semaphore for a host on the running event loop."""
+    loop_bulkheads = _bulkheads.setdefault(asyncio.get_running_loop(), {})
+    bulkhead = loop_bulkheads.get(host)
+    if bulkhead is None:
+        bulkhead = loop_bulkheads[host] = asyncio.Semaphore(BULKHEAD_SIZE)
+    return bulkhead
+
+
+async def _send(
+    session: aiohttp.ClientSession,
+    breaker: CircuitBreaker,
+    method: str,
+    url: str,
+    retries: int,
+    base_delay: float,
+    kwargs: dict,
+) -> aiohttp.ClientResponse:
+    """Send a request, retrying as described in request_with_retry, and update the breaker."""
+    try:
+        for attempt in range(retries + 1):
+            try:
+                response = await session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                breaker.record_failure()
+                if attempt == retries or breaker.state != CircuitBreaker.CLOSED:
+                    raise
+            except Exception:
+                # Not worth retrying (e.g. TooManyRedirects, InvalidURL), but
+                # still a failed call; this also settles a half-open trial
+                breaker.record_failure()
+                raise
+            else:
+                if response.status not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+
+                breaker.record_failure()
+                if attempt == retries or breaker.state != CircuitBreaker.CLOSED:
+                    return response
+                response.release()
+
+            await asyncio.sleep(random.uniform(0, base_delay * 2 ** attempt))
+    except BaseException:
+        # Cancelled mid-request: give up a claimed trial slot so the breaker
+        # can't stay half-open forever
+        breaker.cancel_trial()
+        raise
+
+
+@contextlib.asynccontextmanager
+async def request_with_retry(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    *,
+    retries: int = 3,
+    base_delay: float = 0.25,
+    **kwargs,
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """
+    Send an HTTP request with retries, a per-host circuit breaker and bulkhead.
+
+    Retries use exponential backoff with full jitter and only happen on
+    429/5xx responses, connection errors and timeouts. If every attempt gets
+    a retryable status the last response is returned. Use as
+    ``async with request_with_retry(...) as response:``; the host's bulkhead
+    slot is held until the block exits, so it also bounds body reads, and the
+    response is released on exit.
+
+    Raises:
+        CircuitOpenError: If the host's circuit breaker is open
+    """
+    host = urlsplit(url).netloc
+    breaker = get_breaker(host)
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"Circuit open for {host}")
+
+    bulkhead = _get_bulkhead(host)
+    try:
+        await bulkhead.acquire()
+    except BaseException:
+        breaker.cancel_trial()
+        raise
+
+    try:
+        response = await _send(session, breaker, method, url, retries, base_delay, kwargs)
+        async with response:
+            yield response
+    finally:
+        bulkhead.release()
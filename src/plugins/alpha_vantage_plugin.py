@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator
 
 import aiohttp
 
+from ._http import get_session
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
 
@@ -81,13 +82,12 @@ class AlphaVantagePlugin(DataSourcePlugin):
         self._session = None
 
     async def connect(self) -> bool:
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
         self._connected = True
         return True
 
     async def disconnect(self):
-        if self._session:
-            await self._session.close()
+        self._session = None
         self._connected = False
 
     async def test_connection(self) -> tuple[bool, str]:
@@ -42,7 +42,7 @@ class CredentialField:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DataRecord:
     """A single data record to send to Fractal."""
     source_id: str
@@ -132,6 +132,35 @@ class DataSourcePlugin(ABC):
         """
         pass
 
+    async def fetch_batches(self, size: int = 1000) -> AsyncIterator[list[DataRecord]]:
+        """
+        Fetch data from the source in batches.
+
+        The default implementation groups the output of fetch_data(). Plugins
+        that already read data in blocks can override this to build batches
+        directly.
+
+        Args:
+            size: Maximum number of records per batch
+
+        Yields:
+            Lists of DataRecord objects to be sent to Fractal
+        """
+        batch = []
+        try:
+            async for record in self.fetch_data():
+                batch.append(record)
+                if len(batch) >= size:
+                    yield batch
+                    batch = []
+        except Exception:
+            # Hand over the records fetched before the error, then re-raise
+            if batch:
+                yield batch
+            raise
+        if batch:
+            yield batch
+
     @property
     def is_connected(self) -> bool:
         """Check if currently connected."""
@@ -7,6 +7,7 @@ import time
 
 import aiohttp
 
+from ._http import get_session
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
 
@@ -78,14 +79,12 @@ class CoinbasePlugin(DataSourcePlugin):
         ]
 
     async def connect(self) -> bool:
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
         self._connected = True
         return True
 
     async def disconnect(self):
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._session = None
         self._connected = False
 
     async def test_connection(self) -> tuple[bool, str]:
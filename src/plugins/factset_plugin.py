@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator
 
 import aiohttp
 
+from ._http import get_session
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
 
@@ -93,15 +94,13 @@ class FactSetPlugin(DataSourcePlugin):
 
     async def connect(self) -> bool:
         """Connect to FactSet API."""
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
         self._connected = True
         return True
 
     async def disconnect(self):
         """Disconnect from FactSet."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._session = None
         self._connected = False
 
     def _get_auth(self) -> aiohttp.BasicAuth:
@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator
 
 import aiohttp
 
+from ._http import get_session
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
 
@@ -133,21 +134,18 @@ class ICEConnectPlugin(DataSourcePlugin):
 
     async def connect(self) -> bool:
         """Connect to ICE Connect API."""
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
 
         if await self._authenticate():
             self._connected = True
             return True
         else:
-            await self._session.close()
             self._session = None
             return False
 
     async def disconnect(self):
         """Disconnect from ICE Connect API."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._session = None
         self._access_token = None
         self._connected = False
 
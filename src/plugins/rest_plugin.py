@@ -1,12 +1,18 @@
 """REST API data source plugin."""
 import asyncio
+import logging
 from datetime import datetime
-from typing import Any, AsyncIterator
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping
 
 import aiohttp
 
+from ._http import get_session, read_json
+from ._reliability import request_with_retry
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+logger = logging.getLogger(__name__)
+
 
 class RESTPlugin(DataSourcePlugin):
     """Plugin for fetching data from REST APIs."""
@@ -16,9 +22,19 @@ class RESTPlugin(DataSourcePlugin):
     plugin_description = "Connect to any REST API endpoint"
     plugin_icon = "api"
 
+    # Headers sent with every request; shared read-only when no auth header is needed
+    _BASE_HEADERS = MappingProxyType({
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    })
+
     def __init__(self, source_id: str, credentials: dict[str, Any]):
         super().__init__(source_id, credentials)
         self._session = None
+        # Credentials are fixed for the lifetime of the plugin, so build the
+        # request headers and auth once rather than on every request
+        self._headers = self._build_headers()
+        self._auth = self._build_auth()
 
     @classmethod
     def get_credential_fields(cls) -> list[CredentialField]:
@@ -85,23 +101,18 @@ class RESTPlugin(DataSourcePlugin):
             ),
         ]
 
-    def _build_headers(self) -> dict[str, str]:
+    def _build_headers(self) -> Mapping[str, str]:
         """Build request headers based on auth type."""
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-
         auth_type = self.credentials.get("auth_type", "none")
         api_key = self.credentials.get("api_key", "")
 
         if auth_type == "api_key" and api_key:
             header_name = self.credentials.get("api_key_header", "X-API-Key")
-            headers[header_name] = api_key
+            return {**self._BASE_HEADERS, header_name: api_key}
         elif auth_type == "bearer" and api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+            return {**self._BASE_HEADERS, "Authorization": f"Bearer {api_key}"}
 
-        return headers
+        return self._BASE_HEADERS
 
     def _build_auth(self) -> aiohttp.BasicAuth | None:
         """Build basic auth if configured."""
@@ -117,15 +128,13 @@ class RESTPlugin(DataSourcePlugin):
 
     async def connect(self) -> bool:
         """Create HTTP session."""
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
         self._connected = True
         return True
 
     async def disconnect(self):
-        """Close HTTP session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Release the shared HTTP session."""
+        self._session = None
         self._connected = False
 
     async def test_connection(self) -> tuple[bool, str]:
@@ -140,26 +149,27 @@ class RESTPlugin(DataSourcePlugin):
 
         url = f"{base_url}{endpoint}"
 
+        # Reuse the long-lived session so repeated probes keep the pooled
+        # connection instead of paying a fresh TCP/TLS handshake each time.
+        if self._session is None:
+            self._session = await get_session()
+
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = self._build_headers()
-                auth = self._build_auth()
-
-                async with session.get(url, headers=headers, auth=auth, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if isinstance(data, list):
-                            return True, f"Success! Received {len(data)} records"
-                        else:
-                            return True, "Success! Connected to API"
-                    elif response.status == 401:
-                        return False, "Authentication failed (401)"
-                    elif response.status == 403:
-                        return False, "Access forbidden (403)"
-                    elif response.status == 404:
-                        return False, "Endpoint not found (404)"
+            async with request_with_retry(self._session, "GET", url, headers=self._headers, auth=self._auth, timeout=10) as response:
+                if response.status == 200:
+                    data = await read_json(response)
+                    if isinstance(data, list):
+                        return True, f"Success! Received {len(data)} records"
                     else:
-                        return False, f"HTTP {response.status}: {response.reason}"
+                        return True, "Success! Connected to API"
+                elif response.status == 401:
+                    return False, "Authentication failed (401)"
+                elif response.status == 403:
+                    return False, "Access forbidden (403)"
+                elif response.status == 404:
+                    return False, "Endpoint not found (404)"
+                else:
+                    return False, f"HTTP {response.status}: {response.reason}"
 
         except asyncio.TimeoutError:
             return False, "Connection timeout"
@@ -175,12 +185,9 @@ class RESTPlugin(DataSourcePlugin):
         url = f"{base_url}{endpoint}"
 
         try:
-            headers = self._build_headers()
-            auth = self._build_auth()
-
-            async with self._session.get(url, headers=headers, auth=auth) as response:
+            async with request_with_retry(self._session, "GET", url, headers=self._headers, auth=self._auth) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await read_json(response)
 
                     # Handle both array and object responses
                     if isinstance(data, list):
@@ -210,4 +217,4 @@ class RESTPlugin(DataSourcePlugin):
                         )
 
         except Exception as e:
-            print(f"Error fetching from API: {e}")
+            logger.warning("Error fetching from API %s: %s", url, e)
@@ -1,12 +1,15 @@
 """AWS S3 storage plugin."""
+import asyncio
+import logging
 from datetime import datetime
 from typing import Any, AsyncIterator
 import io
 
-import pandas as pd
-
+from ._csv import iter_csv_rows, read_excel_rows
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+logger = logging.getLogger(__name__)
+
 
 class S3Plugin(DataSourcePlugin):
     """Plugin for AWS S3 storage."""
@@ -79,6 +82,7 @@ class S3Plugin(DataSourcePlugin):
     def __init__(self, source_id: str, credentials: dict[str, Any]):
         super().__init__(source_id, credentials)
         self._s3 = None
+        self._fs = None
 
     async def connect(self) -> bool:
         try:
@@ -89,17 +93,30 @@ class S3Plugin(DataSourcePlugin):
                 aws_secret_access_key=self.credentials.get("aws_secret_key"),
                 region_name=self.credentials.get("region", "us-east-1"),
             )
+
+            # Optional: s3fs gives seekable files backed by ranged reads
+            try:
+                import s3fs
+                self._fs = s3fs.S3FileSystem(
+                    key=self.credentials.get("aws_access_key"),
+                    secret=self.credentials.get("aws_secret_key"),
+                    client_kwargs={"region_name": self.credentials.get("region", "us-east-1")},
+                )
+            except ImportError:
+                self._fs = None
+
             self._connected = True
             return True
         except ImportError:
-            print("boto3 not installed. Run: pip install boto3")
+            logger.error("boto3 not installed. Run: pip install boto3")
             return False
         except Exception as e:
-            print(f"S3 connection error: {e}")
+            logger.error("S3 connection error: %s", e)
             return False
 
     async def disconnect(self):
         self._s3 = None
+        self._fs = None
         self._connected = False
 
     async def test_connection(self) -> tuple[bool, str]:
@@ -122,47 +139,113 @@ class S3Plugin(DataSourcePlugin):
         except Exception as e:
             return False, f"Error: {str(e)}"
 
+    def _read_excel_rows(self, bucket: str, key: str) -> list[dict[str, Any]]:
+        """Read an Excel object into row dicts. Excel readers need a seekable file."""
+        if self._fs is not None:
+            # Let s3fs fetch byte ranges as the reader seeks instead of
+            # downloading the object and copying it into a BytesIO first
+            with self._fs.open(f"{bucket}/{key}", "rb") as f:
+                return read_excel_rows(f)
+
+        body = self._s3.get_object(Bucket=bucket, Key=key)["Body"]
+        try:
+            content = body.read()
+        finally:
+            body.close()
+        return read_excel_rows(io.BytesIO(content))
+
     async def fetch_data(self) -> AsyncIterator[DataRecord]:
+        async for batch in self.fetch_batches():
+            for record in batch:
+                yield record
+
+    async def fetch_batches(self, size: int = 1000) -> AsyncIterator[list[DataRecord]]:
         if not self._s3:
             return
 
         import fnmatch
+        import re
 
         bucket = self.credentials.get("bucket", "")
         prefix = self.credentials.get("prefix", "")
         pattern = self.credentials.get("file_pattern", "*.csv")
+        # Compile the glob once for the whole listing
+        match = re.compile(fnmatch.translate(pattern)).match
         delimiter = self.credentials.get("delimiter", ",")
 
-        try:
-            response = self._s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
-            objects = response.get("Contents", [])
+        # boto3 is blocking, so object reads run in worker threads. Keep the
+        # number of open objects under boto3's default pool of 10 connections.
+        semaphore = asyncio.Semaphore(8)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+        tasks: list[asyncio.Task] = []
 
-            for obj in objects:
-                key = obj["Key"]
-                filename = key.split("/")[-1]
+        async def read_object(key: str, filename: str):
+            """Download and parse one object, queueing lists of row dicts."""
+            try:
+                async with semaphore:
+                    if filename.endswith(('.xlsx', '.xls')):
+                        await queue.put((key, await asyncio.to_thread(self._read_excel_rows, bucket, key)))
+                        return
+
+                    response = await asyncio.to_thread(self._s3.get_object, Bucket=bucket, Key=key)
+                    body = response["Body"]
+
+                    try:
+                        # Parse straight off the StreamingBody so the object
+                        # is never buffered in memory as a whole
+                        chunks = iter_csv_rows(body, delimiter)
+
+                        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                            await queue.put((key, chunk))
+                    finally:
+                        body.close()
+            except Exception as e:
+                logger.warning("Error reading s3://%s/%s: %s", bucket, key, e)
+            finally:
+                await queue.put((key, None))
 
-                if not fnmatch.fnmatch(filename, pattern):
+        try:
+            # list_objects_v2 returns at most 1000 keys per call
+            paginator = self._s3.get_paginator("list_objects_v2")
+            pages = iter(paginator.paginate(Bucket=bucket, Prefix=prefix))
+
+            while (page := await asyncio.to_thread(next, pages, None)) is not None:
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    filename = key.split("/")[-1]
+
+                    if not match(filename):
+                        continue
+
+                    tasks.append(asyncio.create_task(read_object(key, filename)))
+
+            rows: dict[str, int] = {}
+            pending = len(tasks)
+            while pending:
+                key, chunk = await queue.get()
+                if chunk is None:
+                    pending -= 1
                     continue
 
-                try:
-                    response = self._s3.get_object(Bucket=bucket, Key=key)
-                    content = response["Body"].read()
-
-                    if filename.endswith(('.xlsx', '.xls')):
-                        df = pd.read_excel(io.BytesIO(content))
-                    else:
-                        df = pd.read_csv(io.BytesIO(content), delimiter=delimiter)
-
-                    for i, row in df.iterrows():
-                        yield DataRecord(
-                            source_id=self.source_id,
-                            source_type=self.plugin_id,
-                            timestamp=datetime.utcnow().isoformat(),
-                            data=row.to_dict(),
-                            metadata={"bucket": bucket, "key": key, "row": i},
-                        )
-                except Exception as e:
-                    print(f"Error reading {key}: {e}")
+                row = rows.get(key, 0)
+                rows[key] = row + len(chunk)
+                timestamp = datetime.utcnow().isoformat()
+                records = [
+                    DataRecord(
+                        source_id=self.source_id,
+                        source_type=self.plugin_id,
+                        timestamp=timestamp,
+                        data=data,
+                        metadata={"bucket": bucket, "key": key, "row": i},
+                    )
+                    for i, data in enumerate(chunk, row)
+                ]
+                for start in range(0, len(records), size):
+                    yield records[start:start + size]
 
         except Exception as e:
-            print(f"S3 fetch error: {e}")
+            logger.warning("S3 fetch error for bucket %s: %s", bucket, e)
+        finally:
+            # Don't leave downloads running if the consumer stops early
+            for task in tasks:
+                task.cancel()
@@ -1,11 +1,23 @@
 """SEC EDGAR filings plugin."""
+import asyncio
+import logging
 from datetime import datetime
+from itertools import zip_longest
 from typing import Any, AsyncIterator
 
-import aiohttp
 
+from ._http import get_session, read_json
+from ._reliability import request_with_retry
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+logger = logging.getLogger(__name__)
+
+# SEC publishes every ticker -> CIK mapping as one JSON file, so it is fetched
+# once per process and shared by all plugin instances.
+_TICKER_MAP_URL = "https://www.sec.gov/files/company_tickers.json"
+_ticker_map: dict[str, str] | None = None
+_ticker_map_lock = asyncio.Lock()
+
 
 class SECEdgarPlugin(DataSourcePlugin):
     """Plugin for SEC EDGAR filings data."""
@@ -73,33 +85,35 @@ class SECEdgarPlugin(DataSourcePlugin):
         self._session = None
 
     async def connect(self) -> bool:
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
         self._connected = True
         return True
 
     async def disconnect(self):
-        if self._session:
-            await self._session.close()
+        self._session = None
         self._connected = False
 
     async def _ticker_to_cik(self, ticker: str) -> str | None:
         """Convert ticker symbol to CIK."""
-        url = "https://www.sec.gov/cgi-bin/browse-edgar"
-        params = {"action": "getcompany", "CIK": ticker, "type": "", "dateb": "", "owner": "include", "count": "1", "output": "atom"}
-        headers = {"User-Agent": self.credentials.get("user_agent", "FractalConnector contact@example.com")}
-
-        try:
-            async with self._session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    # Parse CIK from response
-                    import re
-                    match = re.search(r'CIK=(\d+)', text)
-                    if match:
-                        return match.group(1).zfill(10)
-        except:
-            pass
-        return None
+        global _ticker_map
+
+        async with _ticker_map_lock:
+            if _ticker_map is None:
+                headers = {"User-Agent": self.credentials.get("user_agent", "FractalConnector contact@example.com")}
+                try:
+                    async with request_with_retry(self._session, "GET", _TICKER_MAP_URL, headers=headers) as response:
+                        if response.status == 200:
+                            companies = await read_json(response)
+                            _ticker_map = {
+                                str(company["ticker"]).upper(): str(company["cik_str"]).zfill(10)
+                                for company in companies.values()
+                            }
+                except Exception:
+                    pass
+
+        if _ticker_map is None:
+            return None
+        return _ticker_map.get(ticker.upper())
 
     async def test_connection(self) -> tuple[bool, str]:
         user_agent = self.credentials.get("user_agent", "")
@@ -111,17 +125,24 @@ class SECEdgarPlugin(DataSourcePlugin):
         if not cik and not ticker:
             return False, "Either CIK or ticker is required"
 
+        if self._session is None:
+            self._session = await get_session()
+
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"User-Agent": user_agent}
-                async with session.get("https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK=AAPL&type=10-K&count=1&output=atom", headers=headers) as response:
-                    if response.status == 200:
-                        return True, "Connected to SEC EDGAR"
-                    return False, f"SEC API returned {response.status}"
+            headers = {"User-Agent": user_agent}
+            async with request_with_retry(self._session, "GET", "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK=AAPL&type=10-K&count=1&output=atom", headers=headers) as response:
+                if response.status == 200:
+                    return True, "Connected to SEC EDGAR"
+                return False, f"SEC API returned {response.status}"
         except Exception as e:
             return False, f"Connection failed: {str(e)}"
 
     async def fetch_data(self) -> AsyncIterator[DataRecord]:
+        async for batch in self.fetch_batches():
+            for record in batch:
+                yield record
+
+    async def fetch_batches(self, size: int = 1000) -> AsyncIterator[list[DataRecord]]:
         if not self._session:
             return
 
@@ -133,50 +154,82 @@ class SECEdgarPlugin(DataSourcePlugin):
 
         headers = {"User-Agent": user_agent}
 
+        # Keep concurrent requests well under SEC's 10 requests/second limit
+        semaphore = asyncio.Semaphore(5)
+
+        async def resolve_ticker(ticker: str) -> str | None:
+            async with semaphore:
+                return await self._ticker_to_cik(ticker)
+
         # Convert tickers to CIKs
-        for ticker in tickers:
-            cik = await self._ticker_to_cik(ticker)
+        for cik in await asyncio.gather(*(resolve_ticker(t) for t in tickers)):
             if cik and cik not in ciks:
                 ciks.append(cik)
 
-        for cik in ciks:
+        async def fetch_submissions(cik: str) -> tuple[str, dict | None]:
+            # Use the submissions API
+            url = f"https://data.sec.gov/submissions/CIK{cik}.json"
             try:
-                # Use the submissions API
-                url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-
-                async with self._session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        company_name = data.get("name", "Unknown")
-                        filings = data.get("filings", {}).get("recent", {})
-
-                        forms = filings.get("form", [])
-                        dates = filings.get("filingDate", [])
-                        accessions = filings.get("accessionNumber", [])
-                        descriptions = filings.get("primaryDocument", [])
-
-                        count = 0
-                        for i, form in enumerate(forms):
-                            if form == filing_type or filing_type in form:
-                                if count >= limit:
-                                    break
-
-                                yield DataRecord(
-                                    source_id=self.source_id,
-                                    source_type=self.plugin_id,
-                                    timestamp=datetime.utcnow().isoformat(),
-                                    data={
-                                        "cik": cik,
-                                        "company": company_name,
-                                        "form_type": form,
-                                        "filing_date": dates[i] if i < len(dates) else None,
-                                        "accession_number": accessions[i] if i < len(accessions) else None,
-                                        "document": descriptions[i] if i < len(descriptions) else None,
-                                        "url": f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}/{accessions[i].replace('-', '')}/{descriptions[i]}" if i < len(accessions) and i < len(descriptions) else None,
-                                    },
-                                    metadata={"filing_type": filing_type},
-                                )
-                                count += 1
-
+                async with semaphore:
+                    async with request_with_retry(self._session, "GET", url, headers=headers) as response:
+                        if response.status == 200:
+                            return cik, await read_json(response)
             except Exception as e:
-                print(f"SEC EDGAR error for CIK {cik}: {e}")
+                logger.warning("SEC EDGAR error for CIK %s: %s", cik, e)
+            return cik, None
+
+        tasks = [asyncio.create_task(fetch_submissions(cik)) for cik in ciks]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                cik, data = await next_done
+                if data is None:
+                    continue
+
+                company_name = data.get("name", "Unknown")
+                filings = data.get("filings", {}).get("recent", {})
+                # One timestamp per CIK batch rather than per filing
+                timestamp = datetime.utcnow().isoformat()
+
+                forms = filings.get("form", [])
+                dates = filings.get("filingDate", [])
+                accessions = filings.get("accessionNumber", [])
+                descriptions = filings.get("primaryDocument", [])
+
+                archive_url = f"https://www.sec.gov/Archives/edgar/data/{cik.lstrip('0')}"
+
+                batch = []
+                # The filing arrays are parallel; zip_longest pads short ones with None
+                for form, date, accession, document in zip_longest(forms, dates, accessions, descriptions):
+                    if form is None:
+                        break
+                    # Substring match also covers the exact match and amendments (10-K/A)
+                    if filing_type in form:
+                        if len(batch) >= limit:
+                            break
+
+                        url = None
+                        if accession is not None and document is not None:
+                            url = f"{archive_url}/{accession.replace('-', '')}/{document}"
+
+                        batch.append(DataRecord(
+                            source_id=self.source_id,
+                            source_type=self.plugin_id,
+                            timestamp=timestamp,
+                            data={
+                                "cik": cik,
+                                "company": company_name,
+                                "form_type": form,
+                                "filing_date": date,
+                                "accession_number": accession,
+                                "document": document,
+                                "url": url,
+                            },
+                            metadata={"filing_type": filing_type},
+                        ))
+
+                for start in range(0, len(batch), size):
+                    yield batch[start:start + size]
+        finally:
+            # Don't leave requests running if the consumer stops early
+            for task in tasks:
+                task.cancel()
@@ -1,13 +1,19 @@
 """FTP/SFTP data source plugin."""
+import asyncio
 import io
 from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator
 
-import pandas as pd
-
+from ._csv import frame_rows, parse_columns, read_csv, read_excel_rows
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+# Rows converted to record dicts at a time
+CSV_CHUNK_ROWS = 50_000
+
+# Parallel READ requests asyncssh keeps in flight per SFTP download
+SFTP_MAX_REQUESTS = 64
+
 
 class SFTPPlugin(DataSourcePlugin):
     """Plugin for FTP/SFTP file sources."""
@@ -19,9 +25,11 @@ class SFTPPlugin(DataSourcePlugin):
 
     def __init__(self, source_id: str, credentials: dict[str, Any]):
         super().__init__(source_id, credentials)
-        self._transport = None
+        self._conn = None
         self._sftp = None
         self._ftp = None
+        # FTP downloads take turns, so they share one buffer
+        self._ftp_buffer = io.BytesIO()
 
     @classmethod
     def get_credential_fields(cls) -> list[CredentialField]:
@@ -114,6 +122,23 @@ class SFTPPlugin(DataSourcePlugin):
                     {"value": "|", "label": "Pipe (|)"},
                 ],
             ),
+            CredentialField(
+                name="concurrency",
+                label="Parallel Downloads",
+                field_type=FieldType.NUMBER,
+                required=False,
+                default=4,
+                placeholder="4",
+                help_text="Number of files to download at once (SFTP only)",
+            ),
+            CredentialField(
+                name="select_columns",
+                label="Columns",
+                field_type=FieldType.TEXT,
+                required=False,
+                placeholder="col_a, col_b",
+                help_text="Comma-separated columns to read; leave empty for all",
+            ),
         ]
 
     async def connect(self) -> bool:
@@ -128,20 +153,19 @@ class SFTPPlugin(DataSourcePlugin):
 
         try:
             if protocol == "sftp":
-                import paramiko
+                import asyncssh
 
                 default_port = 22
                 port = int(port) if port else default_port
 
-                self._transport = paramiko.Transport((host, port))
-
+                options = {"username": username, "known_hosts": None}
                 if auth_type == "key" and private_key_path:
-                    private_key = paramiko.RSAKey.from_private_key_file(private_key_path)
-                    self._transport.connect(username=username, pkey=private_key)
+                    options["client_keys"] = [private_key_path]
                 else:
-                    self._transport.connect(username=username, password=password)
+                    options["password"] = password
 
-                self._sftp = paramiko.SFTPClient.from_transport(self._transport)
+                self._conn = await asyncssh.connect(host, port=port, **options)
+                self._sftp = await self._conn.start_sftp_client()
 
             else:  # FTP or FTPS
                 from ftplib import FTP, FTP_TLS
@@ -173,11 +197,12 @@ class SFTPPlugin(DataSourcePlugin):
     async def disconnect(self):
         """Disconnect from server."""
         if self._sftp:
-            self._sftp.close()
+            self._sftp.exit()
             self._sftp = None
-        if self._transport:
-            self._transport.close()
-            self._transport = None
+        if self._conn:
+            self._conn.close()
+            await self._conn.wait_closed()
+            self._conn = None
         if self._ftp:
             try:
                 self._ftp.quit()
@@ -186,6 +211,25 @@ class SFTPPlugin(DataSourcePlugin):
             self._ftp = None
         self._connected = False
 
+    async def _list_files(self, remote_path: str) -> list[str]:
+        """List file names in a remote directory."""
+        if self._sftp:
+            return [f for f in await self._sftp.listdir(remote_path) if f not in (".", "..")]
+
+        def list_ftp() -> list[str]:
+            from ftplib import error_perm
+
+            self._ftp.cwd(remote_path)
+            try:
+                # MLSD reports entry types, so directories are skipped
+                # without probing each name
+                return [name for name, facts in self._ftp.mlsd(facts=["type"]) if facts.get("type") == "file"]
+            except error_perm:
+                # Server doesn't support MLSD
+                return self._ftp.nlst()
+
+        return await asyncio.to_thread(list_ftp)
+
     async def test_connection(self) -> tuple[bool, str]:
         """Test connection."""
         host = self.credentials.get("host", "")
@@ -202,13 +246,7 @@ class SFTPPlugin(DataSourcePlugin):
         try:
             if await self.connect():
                 # Try to list directory
-                protocol = self.credentials.get("protocol", "sftp")
-
-                if protocol == "sftp":
-                    files = self._sftp.listdir(remote_path)
-                else:
-                    self._ftp.cwd(remote_path)
-                    files = self._ftp.nlst()
+                files = await self._list_files(remote_path)
 
                 await self.disconnect()
                 return True, f"Connected! Found {len(files)} items in {remote_path}"
@@ -219,10 +257,21 @@ class SFTPPlugin(DataSourcePlugin):
             await self.disconnect()
             return False, f"Error: {str(e)[:100]}"
 
-    def _match_pattern(self, filename: str, pattern: str) -> bool:
-        """Check if filename matches glob pattern."""
+    @staticmethod
+    def _compile_pattern(pattern: str):
+        """Compile a glob pattern once into a filename match function."""
         import fnmatch
-        return fnmatch.fnmatch(filename, pattern)
+        import re
+        return re.compile(fnmatch.translate(pattern)).match
+
+    def _download_ftp(self, filename: str) -> io.BytesIO:
+        """Download a whole file over FTP into the shared buffer."""
+        buffer = self._ftp_buffer
+        buffer.seek(0)
+        buffer.truncate(0)
+        self._ftp.retrbinary(f"RETR {filename}", buffer.write)
+        buffer.seek(0)
+        return buffer
 
     async def fetch_data(self) -> AsyncIterator[DataRecord]:
         """Fetch files from FTP/SFTP."""
@@ -233,57 +282,93 @@ class SFTPPlugin(DataSourcePlugin):
         file_pattern = self.credentials.get("file_pattern", "*.csv")
         delimiter = self.credentials.get("delimiter", ",")
         protocol = self.credentials.get("protocol", "sftp")
+        columns = parse_columns(self.credentials.get("select_columns"))
+
+        # asyncssh runs many transfers over one SFTP session; ftplib blocks
+        # and has a single control connection, so FTP transfers take turns
+        # in a worker thread
+        if protocol == "sftp":
+            concurrency = max(1, int(self.credentials.get("concurrency") or 4))
+        else:
+            concurrency = 1
+        # A slot is held from the start of a download until its records have
+        # all been emitted, so at most `concurrency` files are in memory
+        slots = asyncio.Semaphore(concurrency)
+
+        downloaded: asyncio.Queue = asyncio.Queue()
+        tasks: list[asyncio.Task] = []
+
+        async def download_one(filename: str):
+            """Download one file's raw bytes and queue them for parsing."""
+            await slots.acquire()
+            try:
+                if protocol == "sftp":
+                    full_path = f"{remote_path.rstrip('/')}/{filename}"
+                    async with self._sftp.open(full_path, "rb", max_requests=SFTP_MAX_REQUESTS) as f:
+                        content = io.BytesIO(await f.read())
+                else:
+                    content = await asyncio.to_thread(self._download_ftp, filename)
+            except Exception as e:
+                slots.release()
+                print(f"Error processing {filename}: {e}")
+                content = None
+            await downloaded.put((filename, content))
 
         try:
             # List files
-            if protocol == "sftp":
-                files = self._sftp.listdir(remote_path)
-            else:
-                self._ftp.cwd(remote_path)
-                files = self._ftp.nlst()
+            files = await self._list_files(remote_path)
 
             # Filter by pattern
-            matching_files = [f for f in files if self._match_pattern(f, file_pattern)]
-
-            for filename in matching_files:
-                full_path = f"{remote_path.rstrip('/')}/{filename}"
+            match = self._compile_pattern(file_pattern)
+            matching_files = [f for f in files if match(f)]
+            tasks.extend(asyncio.create_task(download_one(f)) for f in matching_files)
+
+            # Files are emitted in the order their downloads finish. Each is
+            # parsed whole before any of its records go out, so every record
+            # can carry total_rows and a file that fails to parse is skipped
+            for _ in matching_files:
+                filename, content = await downloaded.get()
+                if content is None:
+                    continue
 
                 try:
-                    # Download file content
-                    if protocol == "sftp":
-                        with io.BytesIO() as buffer:
-                            self._sftp.getfo(full_path, buffer)
-                            buffer.seek(0)
-                            content = buffer.read()
-                    else:
-                        buffer = io.BytesIO()
-                        self._ftp.retrbinary(f"RETR {filename}", buffer.write)
-                        buffer.seek(0)
-                        content = buffer.read()
-
-                    # Parse CSV/Excel
-                    if filename.endswith(('.xlsx', '.xls')):
-                        df = pd.read_excel(io.BytesIO(content))
-                    else:
-                        df = pd.read_csv(io.BytesIO(content), delimiter=delimiter)
-
-                    records = df.to_dict(orient='records')
-
-                    for i, record in enumerate(records):
-                        yield DataRecord(
-                            source_id=self.source_id,
-                            source_type=self.plugin_id,
-                            timestamp=datetime.utcnow().isoformat(),
-                            data=record,
-                            metadata={
-                                "file": filename,
-                                "row_index": i,
-                                "total_rows": len(records),
-                            },
-                        )
-
-                except Exception as e:
-                    print(f"Error processing {filename}: {e}")
+                    try:
+                        if filename.endswith(('.xlsx', '.xls')):
+                            records = await asyncio.to_thread(read_excel_rows, content, columns)
+                            total_rows = len(records)
+                            chunks = iter([records])
+                        else:
+                            df = await asyncio.to_thread(read_csv, content, delimiter, columns)
+                            total_rows = len(df)
+                            chunks = frame_rows(df, CSV_CHUNK_ROWS)
+                    except Exception as e:
+                        print(f"Error processing {filename}: {e}")
+                        continue
+                    del content
+
+                    row = 0
+                    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                        # One timestamp per chunk rather than per row
+                        timestamp = datetime.utcnow().isoformat()
+                        for record in chunk:
+                            yield DataRecord(
+                                source_id=self.source_id,
+                                source_type=self.plugin_id,
+                                timestamp=timestamp,
+                                data=record,
+                                metadata={
+                                    "file": filename,
+                                    "row_index": row,
+                                    "total_rows": total_rows,
+                                },
+                            )
+                            row += 1
+                finally:
+                    slots.release()
 
         except Exception as e:
             print(f"FTP/SFTP fetch error: {e}")
+        finally:
+            # Don't leave downloads running if the consumer stops early
+            for task in tasks:
+                task.cancel()
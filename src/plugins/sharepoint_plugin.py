@@ -1,13 +1,17 @@
 """SharePoint / OneDrive plugin."""
+import asyncio
+import logging
+import time
 from datetime import datetime
 from typing import Any, AsyncIterator
 import io
 
-import pandas as pd
-import aiohttp
-
+from ._csv import iter_csv_rows, parse_columns, read_excel_rows
+from ._http import get_session
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+logger = logging.getLogger(__name__)
+
 
 class SharePointPlugin(DataSourcePlugin):
     """Plugin for SharePoint / OneDrive."""
@@ -68,14 +72,27 @@ class SharePointPlugin(DataSourcePlugin):
                 required=False,
                 default="*.csv",
             ),
+            CredentialField(
+                name="select_columns",
+                label="Columns",
+                field_type=FieldType.TEXT,
+                required=False,
+                placeholder="col_a, col_b",
+                help_text="Comma-separated columns to read; leave empty for all",
+            ),
         ]
 
     def __init__(self, source_id: str, credentials: dict[str, Any]):
         super().__init__(source_id, credentials)
         self._session = None
         self._access_token = None
+        self._token_expiry = 0.0
 
     async def _get_token(self) -> str | None:
+        # Reuse the cached token until a minute before it expires
+        if self._access_token and time.monotonic() < self._token_expiry - 60:
+            return self._access_token
+
         tenant_id = self.credentials.get("tenant_id", "")
         client_id = self.credentials.get("client_id", "")
         client_secret = self.credentials.get("client_secret", "")
@@ -89,28 +106,27 @@ class SharePointPlugin(DataSourcePlugin):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("access_token")
+            session = await get_session()
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    self._access_token = result.get("access_token")
+                    self._token_expiry = time.monotonic() + int(result.get("expires_in", 3600))
+                    return self._access_token
         except Exception as e:
-            print(f"Token error: {e}")
+            logger.error("Token error: %s", e)
         return None
 
     async def connect(self) -> bool:
-        self._access_token = await self._get_token()
-        if self._access_token:
-            self._session = aiohttp.ClientSession()
+        if await self._get_token():
+            self._session = await get_session()
             self._connected = True
             return True
         return False
 
     async def disconnect(self):
-        if self._session:
-            await self._session.close()
+        # The access token stays cached so a reconnect can reuse it
         self._session = None
-        self._access_token = None
         self._connected = False
 
     async def test_connection(self) -> tuple[bool, str]:
@@ -128,17 +144,26 @@ class SharePointPlugin(DataSourcePlugin):
         return False, "Authentication failed"
 
     async def fetch_data(self) -> AsyncIterator[DataRecord]:
-        if not self._session or not self._access_token:
+        if not self._session:
+            return
+
+        # Refreshes the token if it has expired since connect()
+        access_token = await self._get_token()
+        if not access_token:
             return
 
         import fnmatch
+        import re
 
         site_url = self.credentials.get("site_url", "")
         drive_id = self.credentials.get("drive_id", "")
         folder_path = self.credentials.get("folder_path", "").strip("/")
         pattern = self.credentials.get("file_pattern", "*.csv")
+        columns = parse_columns(self.credentials.get("select_columns"))
+        # Compile the glob once for the whole listing
+        match = re.compile(fnmatch.translate(pattern)).match
 
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        headers = {"Authorization": f"Bearer {access_token}"}
 
         # Build the API URL
         if site_url:
@@ -158,41 +183,82 @@ class SharePointPlugin(DataSourcePlugin):
         else:
             list_url = f"{drive_url}/root/children"
 
+        # Bounds the files held in memory: a slot is taken before a download
+        # starts and only given back once that file has been parsed, so
+        # downloads can't run ahead of parsing
+        slots = asyncio.Semaphore(8)
+
+        async def download(name: str, download_url: str) -> tuple[str, bytes | None]:
+            await slots.acquire()
+            try:
+                async with self._session.get(download_url) as file_response:
+                    if file_response.status == 200:
+                        return name, await file_response.read()
+            except Exception as e:
+                logger.warning("Error downloading %s: %s", name, e)
+            slots.release()
+            return name, None
+
+        tasks: list[asyncio.Task] = []
         try:
-            async with self._session.get(list_url, headers=headers) as response:
-                if response.status == 200:
+            # Only ask for the fields we use. Large folders are split across
+            # pages linked by @odata.nextLink, which already carries the query.
+            params = {"$select": "name,@microsoft.graph.downloadUrl", "$top": "200"}
+            while list_url:
+                async with self._session.get(list_url, headers=headers, params=params) as response:
+                    if response.status != 200:
+                        break
                     data = await response.json()
-                    files = data.get("value", [])
-
-                    for file_info in files:
-                        name = file_info.get("name", "")
-                        if not fnmatch.fnmatch(name, pattern):
-                            continue
-
-                        download_url = file_info.get("@microsoft.graph.downloadUrl")
-                        if not download_url:
-                            continue
-
-                        async with self._session.get(download_url) as file_response:
-                            if file_response.status == 200:
-                                content = await file_response.read()
-
-                                try:
-                                    if name.endswith(('.xlsx', '.xls')):
-                                        df = pd.read_excel(io.BytesIO(content))
-                                    else:
-                                        df = pd.read_csv(io.BytesIO(content))
-
-                                    for i, row in df.iterrows():
-                                        yield DataRecord(
-                                            source_id=self.source_id,
-                                            source_type=self.plugin_id,
-                                            timestamp=datetime.utcnow().isoformat(),
-                                            data=row.to_dict(),
-                                            metadata={"file": name, "row": i},
-                                        )
-                                except Exception as e:
-                                    print(f"Error reading {name}: {e}")
+
+                for file_info in data.get("value", []):
+                    name = file_info.get("name", "")
+                    if not match(name):
+                        continue
+
+                    download_url = file_info.get("@microsoft.graph.downloadUrl")
+                    if not download_url:
+                        continue
+
+                    # Start downloading while later pages are listed
+                    tasks.append(asyncio.create_task(download(name, download_url)))
+
+                list_url = data.get("@odata.nextLink")
+                params = None
+
+            # Parse each file as soon as its download completes
+            for next_done in asyncio.as_completed(tasks):
+                name, content = await next_done
+                if content is None:
+                    continue
+
+                try:
+                    # Parse in a worker thread so other downloads keep going
+                    if name.endswith(('.xlsx', '.xls')):
+                        chunks = iter([await asyncio.to_thread(read_excel_rows, io.BytesIO(content), columns)])
+                    else:
+                        chunks = iter_csv_rows(io.BytesIO(content), columns=columns)
+
+                    i = 0
+                    while (records := await asyncio.to_thread(next, chunks, None)) is not None:
+                        # One timestamp per chunk rather than per row
+                        timestamp = datetime.utcnow().isoformat()
+                        for record in records:
+                            yield DataRecord(
+                                source_id=self.source_id,
+                                source_type=self.plugin_id,
+                                timestamp=timestamp,
+                                data=record,
+                                metadata={"file": name, "row": i},
+                            )
+                            i += 1
+                except Exception as e:
+                    logger.warning("Error reading %s: %s", name, e)
+                finally:
+                    slots.release()
 
         except Exception as e:
-            print(f"SharePoint fetch error: {e}")
+            logger.warning("SharePoint fetch error: %s", e)
+        finally:
+            # Don't leave downloads running if the consumer stops early
+            for task in tasks:
+                task.cancel()
@@ -1,9 +1,62 @@
 """Snowflake data source plugin."""
+import asyncio
 from datetime import datetime
-from typing import Any, AsyncIterator
+from decimal import Decimal
+from typing import Any, AsyncIterator, Iterator
 
+from ._csv import arrow_rows, parse_columns
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+# Rows per fetchmany() call when Arrow results aren't available
+FETCH_ROWS = 10_000
+
+# Snowflake column types (constants.FIELD_ID_TO_NAME) the driver returns as
+# date/time objects, and types it returns as JSON-ready Python values. FIXED
+# columns with a scale come back as Decimal.
+_ISO_TYPES = frozenset({"DATE", "TIME", "TIMESTAMP", "TIMESTAMP_LTZ", "TIMESTAMP_TZ", "TIMESTAMP_NTZ"})
+_PLAIN_TYPES = frozenset({"FIXED", "REAL", "TEXT", "BOOLEAN", "VARIANT", "OBJECT", "ARRAY"})
+
+
+def _identity(value):
+    return value
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def _decimal(value):
+    return float(value) if value is not None else None
+
+
+def _convert_value(value):
+    """Convert a value of unknown column type."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, '__dict__'):
+        return str(value)
+    return value
+
+
+def _column_converters(description) -> list:
+    """Pick a value converter per result column from its Snowflake type."""
+    from snowflake.connector.constants import FIELD_ID_TO_NAME
+
+    converters = []
+    for desc in description:
+        type_name = FIELD_ID_TO_NAME.get(desc[1])
+        if type_name in _ISO_TYPES:
+            converters.append(_isoformat)
+        elif type_name == "FIXED" and desc[5]:
+            converters.append(_decimal)
+        elif type_name in _PLAIN_TYPES:
+            converters.append(_identity)
+        else:
+            converters.append(_convert_value)
+    return converters
+
 
 class SnowflakePlugin(DataSourcePlugin):
     """Plugin for Snowflake Data Warehouse."""
@@ -97,6 +150,14 @@ class SnowflakePlugin(DataSourcePlugin):
                 required=True,
                 placeholder="SELECT * FROM my_table",
             ),
+            CredentialField(
+                name="select_columns",
+                label="Columns",
+                field_type=FieldType.TEXT,
+                required=False,
+                placeholder="col_a, col_b",
+                help_text="Comma-separated columns to read; leave empty for all",
+            ),
         ]
 
     async def connect(self) -> bool:
@@ -197,8 +258,55 @@ class SnowflakePlugin(DataSourcePlugin):
         except Exception as e:
             return False, f"Error: {str(e)[:100]}"
 
+    @staticmethod
+    def _iter_rows(cursor) -> Iterator[list[dict[str, Any]]]:
+        """Yield an executed query's results in lists of row dicts."""
+        from snowflake.connector.errors import NotSupportedError
+
+        try:
+            # Arrow result batches are converted column-wise in C++
+            batches = cursor.fetch_arrow_batches()
+        except NotSupportedError:
+            batches = None
+
+        if batches is not None:
+            for batch in batches:
+                yield arrow_rows(batch)
+            return
+
+        # JSON result format or no pyarrow: fetch rows in blocks
+        columns = tuple(desc[0] for desc in cursor.description)
+        # Resolve each column's conversion once instead of type-checking every
+        # cell, and only visit the columns that actually need converting
+        converted = [
+            (j, convert)
+            for j, convert in enumerate(_column_converters(cursor.description))
+            if convert is not _identity
+        ]
+        cursor.arraysize = FETCH_ROWS
+
+        while rows := cursor.fetchmany():
+            if not converted:
+                yield [dict(zip(columns, row)) for row in rows]
+                continue
+
+            records = []
+            append = records.append
+            for row in rows:
+                values = list(row)
+                for j, convert in converted:
+                    values[j] = convert(values[j])
+                append(dict(zip(columns, values)))
+            yield records
+
     async def fetch_data(self) -> AsyncIterator[DataRecord]:
         """Execute query and yield results."""
+        async for batch in self.fetch_batches():
+            for record in batch:
+                yield record
+
+    async def fetch_batches(self, size: int = 1000) -> AsyncIterator[list[DataRecord]]:
+        """Execute query and yield results in batches built from each fetched block."""
         if not self._conn:
             return
 
@@ -206,30 +314,38 @@ class SnowflakePlugin(DataSourcePlugin):
         if not query:
             return
 
+        # Project in Snowflake so unused columns are never transferred
+        columns = parse_columns(self.credentials.get("select_columns"))
+        if columns:
+            query = f"SELECT {', '.join(columns)} FROM ({query.rstrip().rstrip(';')})"
+
         try:
             cursor = self._conn.cursor()
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-
-            for i, row in enumerate(cursor):
-                record = {}
-                for j, col in enumerate(columns):
-                    value = row[j]
-                    if isinstance(value, datetime):
-                        value = value.isoformat()
-                    elif hasattr(value, '__dict__'):
-                        value = str(value)
-                    record[col] = value
-
-                yield DataRecord(
-                    source_id=self.source_id,
-                    source_type=self.plugin_id,
-                    timestamp=datetime.utcnow().isoformat(),
-                    data=record,
-                    metadata={"row_index": i},
-                )
-
-            cursor.close()
+            try:
+                # The connector is blocking, so run it in a worker thread
+                await asyncio.to_thread(cursor.execute, query)
+                chunks = self._iter_rows(cursor)
+
+                offset = 0
+                while (records := await asyncio.to_thread(next, chunks, None)) is not None:
+                    # One timestamp per fetched batch rather than per row
+                    timestamp = datetime.utcnow().isoformat()
+                    batch = [
+                        DataRecord(
+                            source_id=self.source_id,
+                            source_type=self.plugin_id,
+                            timestamp=timestamp,
+                            data=record,
+                            metadata={"row_index": i},
+                        )
+                        for i, record in enumerate(records, offset)
+                    ]
+                    offset += len(records)
+
+                    for start in range(0, len(batch), size):
+                        yield batch[start:start + size]
+            finally:
+                cursor.close()
 
         except Exception as e:
             print(f"Snowflake query error: {e}")
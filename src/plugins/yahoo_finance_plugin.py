@@ -1,9 +1,103 @@
 """Yahoo Finance data plugin."""
+import asyncio
+import functools
+import logging
+import math
+import random
+import time
 from datetime import datetime
 from typing import Any, AsyncIterator
 
 from .base import DataSourcePlugin, CredentialField, FieldType, DataRecord
 
+try:
+    import yfinance as yf
+except ImportError:
+    yf = None
+
+try:
+    from yfinance.exceptions import YFException, YFRateLimitError
+except ImportError:
+    # yfinance missing or too old to raise these; nothing will raise them
+    class YFException(Exception):
+        pass
+
+    class YFRateLimitError(YFException):
+        pass
+
+logger = logging.getLogger(__name__)
+
+# Price history columns sent for each row, in output order
+_HISTORY_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Seconds fetched info/financials/holders/recommendations are reused across
+# sync cycles
+DATA_TTL = 300.0
+
+_data_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+
+# Retries after a Yahoo rate limit, with exponential backoff capped at
+# RATE_LIMIT_MAX_DELAY seconds
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BASE_DELAY = 1.0
+RATE_LIMIT_MAX_DELAY = 30.0
+
+# Errors expected from a failed Yahoo request. yfinance's own errors
+# (rate limits, delisted or invalid symbols, bad periods) are YFExceptions;
+# requests' and curl_cffi's HTTP and connection errors are OSErrors;
+# malformed or missing data surfaces as KeyError/ValueError. Only these
+# make test_connection fall back from fast_info to info.
+_FETCH_ERRORS = (YFException, OSError, KeyError, ValueError)
+
+
+def _parse_symbols(value: str) -> list[str]:
+    """Parse the symbols credential: upper-cased, empties and duplicates dropped, order kept."""
+    return list(dict.fromkeys(s.strip().upper() for s in value.split(",") if s.strip()))
+
+
+def _with_backoff(func, *args, **kwargs):
+    """
+    Call a blocking yfinance function, retrying when Yahoo rate limits us.
+
+    Sleeps with full jitter between attempts so parallel workers don't retry
+    in lockstep. Runs in worker threads, so time.sleep is fine here.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            return func(*args, **kwargs)
+        except YFRateLimitError:
+            if attempt == RATE_LIMIT_RETRIES:
+                raise
+            delay = min(RATE_LIMIT_MAX_DELAY, RATE_LIMIT_BASE_DELAY * 2 ** attempt)
+            time.sleep(random.uniform(0, delay))
+
+
+@functools.lru_cache(maxsize=128)
+def _get_ticker(symbol: str):
+    """Get a shared yf.Ticker for a symbol."""
+    return yf.Ticker(symbol)
+
+
+def _ticker_data(symbol: str, attr: str) -> Any:
+    """Get a Ticker data attribute (e.g. info), reusing it for DATA_TTL seconds."""
+    key = (symbol, attr)
+    now = time.monotonic()
+    cached = _data_cache.get(key)
+    if cached and now - cached[0] < DATA_TTL:
+        return cached[1]
+
+    value = _with_backoff(getattr, _get_ticker(symbol), attr)
+    _data_cache[key] = (now, value)
+    return value
+
+
+def _last_price(symbol: str) -> float | None:
+    """Get a symbol's last price from fast_info, None if Yahoo has no price for it."""
+    price = _with_backoff(getattr, _get_ticker(symbol).fast_info, "last_price")
+    if price is None or math.isnan(price):
+        return None
+    return price
+
 
 class YahooFinancePlugin(DataSourcePlugin):
     """Plugin for Yahoo Finance data via yfinance."""
@@ -13,184 +107,228 @@ class YahooFinancePlugin(DataSourcePlugin):
     plugin_description = "Free stock data from Yahoo Finance"
     plugin_icon = "trending_up"
 
+    # Built once; get_credential_fields() is called on every /api/plugins request
+    _CREDENTIAL_FIELDS = (
+        CredentialField(
+            name="symbols",
+            label="Symbols",
+            field_type=FieldType.TEXT,
+            required=True,
+            placeholder="AAPL, MSFT, GOOGL",
+            help_text="Comma-separated stock symbols",
+        ),
+        CredentialField(
+            name="data_type",
+            label="Data Type",
+            field_type=FieldType.SELECT,
+            required=True,
+            default="history",
+            options=[
+                {"value": "history", "label": "Historical Prices"},
+                {"value": "info", "label": "Company Info"},
+                {"value": "financials", "label": "Financial Statements"},
+                {"value": "holders", "label": "Institutional Holders"},
+                {"value": "recommendations", "label": "Analyst Recommendations"},
+            ],
+        ),
+        CredentialField(
+            name="period",
+            label="Period",
+            field_type=FieldType.SELECT,
+            required=False,
+            default="1mo",
+            options=[
+                {"value": "1d", "label": "1 Day"},
+                {"value": "5d", "label": "5 Days"},
+                {"value": "1mo", "label": "1 Month"},
+                {"value": "3mo", "label": "3 Months"},
+                {"value": "6mo", "label": "6 Months"},
+                {"value": "1y", "label": "1 Year"},
+                {"value": "2y", "label": "2 Years"},
+                {"value": "5y", "label": "5 Years"},
+                {"value": "max", "label": "Max"},
+            ],
+        ),
+        CredentialField(
+            name="interval",
+            label="Interval",
+            field_type=FieldType.SELECT,
+            required=False,
+            default="1d",
+            options=[
+                {"value": "1m", "label": "1 Minute"},
+                {"value": "5m", "label": "5 Minutes"},
+                {"value": "15m", "label": "15 Minutes"},
+                {"value": "1h", "label": "1 Hour"},
+                {"value": "1d", "label": "1 Day"},
+                {"value": "1wk", "label": "1 Week"},
+                {"value": "1mo", "label": "1 Month"},
+            ],
+        ),
+    )
+
     @classmethod
     def get_credential_fields(cls) -> list[CredentialField]:
-        return [
-            CredentialField(
-                name="symbols",
-                label="Symbols",
-                field_type=FieldType.TEXT,
-                required=True,
-                placeholder="AAPL, MSFT, GOOGL",
-                help_text="Comma-separated stock symbols",
-            ),
-            CredentialField(
-                name="data_type",
-                label="Data Type",
-                field_type=FieldType.SELECT,
-                required=True,
-                default="history",
-                options=[
-                    {"value": "history", "label": "Historical Prices"},
-                    {"value": "info", "label": "Company Info"},
-                    {"value": "financials", "label": "Financial Statements"},
-                    {"value": "holders", "label": "Institutional Holders"},
-                    {"value": "recommendations", "label": "Analyst Recommendations"},
-                ],
-            ),
-            CredentialField(
-                name="period",
-                label="Period",
-                field_type=FieldType.SELECT,
-                required=False,
-                default="1mo",
-                options=[
-                    {"value": "1d", "label": "1 Day"},
-                    {"value": "5d", "label": "5 Days"},
-                    {"value": "1mo", "label": "1 Month"},
-                    {"value": "3mo", "label": "3 Months"},
-                    {"value": "6mo", "label": "6 Months"},
-                    {"value": "1y", "label": "1 Year"},
-                    {"value": "2y", "label": "2 Years"},
-                    {"value": "5y", "label": "5 Years"},
-                    {"value": "max", "label": "Max"},
-                ],
-            ),
-            CredentialField(
-                name="interval",
-                label="Interval",
-                field_type=FieldType.SELECT,
-                required=False,
-                default="1d",
-                options=[
-                    {"value": "1m", "label": "1 Minute"},
-                    {"value": "5m", "label": "5 Minutes"},
-                    {"value": "15m", "label": "15 Minutes"},
-                    {"value": "1h", "label": "1 Hour"},
-                    {"value": "1d", "label": "1 Day"},
-                    {"value": "1wk", "label": "1 Week"},
-                    {"value": "1mo", "label": "1 Month"},
-                ],
-            ),
-        ]
+        return list(cls._CREDENTIAL_FIELDS)
 
     def __init__(self, source_id: str, credentials: dict[str, Any]):
         super().__init__(source_id, credentials)
         self._yf = None
 
     async def connect(self) -> bool:
-        try:
-            import yfinance as yf
-            self._yf = yf
-            self._connected = True
-            return True
-        except ImportError:
+        if yf is None:
             print("yfinance not installed. Run: pip install yfinance")
             return False
+        self._yf = yf
+        self._connected = True
+        return True
 
     async def disconnect(self):
         self._yf = None
         self._connected = False
 
     async def test_connection(self) -> tuple[bool, str]:
-        symbols = self.credentials.get("symbols", "")
+        symbols = _parse_symbols(self.credentials.get("symbols", ""))
         if not symbols:
             return False, "At least one symbol is required"
+        if yf is None:
+            return False, "yfinance not installed. Run: pip install yfinance"
 
+        first_symbol = symbols[0]
         try:
-            import yfinance as yf
-            first_symbol = symbols.split(",")[0].strip()
-            ticker = yf.Ticker(first_symbol)
-            info = ticker.info
-            if info:
-                name = info.get("shortName", first_symbol)
-                return True, f"Connected! Found: {name}"
+            try:
+                # fast_info needs only a small quote request, where info pulls
+                # several summary modules
+                price = await asyncio.to_thread(_last_price, first_symbol)
+            except _FETCH_ERRORS:
+                logger.debug("fast_info failed for %s, falling back to info", first_symbol, exc_info=True)
+                info = await asyncio.to_thread(_ticker_data, first_symbol, "info")
+                if info:
+                    name = info.get("shortName", first_symbol)
+                    return True, f"Connected! Found: {name}"
+                return False, "Could not fetch data"
+
+            if price is not None:
+                return True, f"Connected! Found: {first_symbol} at {price:.2f}"
             return False, "Could not fetch data"
-        except ImportError:
-            return False, "yfinance not installed. Run: pip install yfinance"
         except Exception as e:
+            logger.warning("Yahoo Finance connection test failed for %s", first_symbol, exc_info=True)
             return False, f"Error: {str(e)}"
 
+    def _fetch_symbol(self, symbol: str, data_type: str, period: str, interval: str) -> list[DataRecord]:
+        """Fetch one symbol's records. yfinance blocks, so this runs in a worker thread."""
+        records = []
+        # Fields shared by every record for this symbol, built once
+        source_id = self.source_id
+        source_type = self.plugin_id
+        timestamp = datetime.utcnow().isoformat()
+        metadata = {"data_type": data_type}
+
+        if data_type == "history":
+            # Per-symbol history keeps each symbol's own exchange-tz dates
+            # and dtypes; yf.download() would realign every symbol onto one
+            # union index and timezone
+            hist = _with_backoff(_get_ticker(symbol).history, period=period, interval=interval)
+            if hist.empty:
+                return records
+            # Convert whole columns at once rather than row by row. iterrows()
+            # upcast every value to float, Volume included, so cast to match
+            rows = hist[_HISTORY_COLUMNS].astype("float64").rename(columns=str.lower).to_dict(orient="records")
+            dates = hist.index.astype(str).tolist()
+
+            for date, row in zip(dates, rows):
+                records.append(DataRecord(
+                    source_id=source_id,
+                    source_type=source_type,
+                    timestamp=timestamp,
+                    data={"symbol": symbol, "date": date, **row},
+                    metadata=metadata,
+                ))
+
+        elif data_type == "info":
+            # A fresh dict, so the cached info is never modified. symbol comes
+            # first, and info's own symbol key wins as it did before
+            data = {"symbol": symbol}
+            data.update(_ticker_data(symbol, "info"))
+            records.append(DataRecord(
+                source_id=source_id,
+                source_type=source_type,
+                timestamp=timestamp,
+                data=data,
+                metadata=metadata,
+            ))
+
+        elif data_type == "financials":
+            for period_name, df in [("annual", _ticker_data(symbol, "financials")), ("quarterly", _ticker_data(symbol, "quarterly_financials"))]:
+                if df is not None and not df.empty:
+                    # One record per reporting date (column), converted in a single pass
+                    for col, values in df.to_dict(orient="dict").items():
+                        record = {"symbol": symbol, "period": period_name, "date": str(col)}
+                        record.update((str(idx), value) for idx, value in values.items())
+                        records.append(DataRecord(
+                            source_id=source_id,
+                            source_type=source_type,
+                            timestamp=timestamp,
+                            data=record,
+                            metadata=metadata,
+                        ))
+
+        elif data_type == "holders":
+            holders = _ticker_data(symbol, "institutional_holders")
+            if holders is not None:
+                for row in holders.to_dict(orient="records"):
+                    records.append(DataRecord(
+                        source_id=source_id,
+                        source_type=source_type,
+                        timestamp=timestamp,
+                        data={"symbol": symbol, **row},
+                        metadata=metadata,
+                    ))
+
+        elif data_type == "recommendations":
+            recs = _ticker_data(symbol, "recommendations")
+            if recs is not None:
+                for idx, row in zip(recs.index, recs.to_dict(orient="records")):
+                    records.append(DataRecord(
+                        source_id=source_id,
+                        source_type=source_type,
+                        timestamp=timestamp,
+                        data={"symbol": symbol, "date": str(idx), **row},
+                        metadata=metadata,
+                    ))
+
+        return records
+
     async def fetch_data(self) -> AsyncIterator[DataRecord]:
         if not self._yf:
             return
 
-        symbols = [s.strip() for s in self.credentials.get("symbols", "").split(",")]
+        symbols = _parse_symbols(self.credentials.get("symbols", ""))
         data_type = self.credentials.get("data_type", "history")
         period = self.credentials.get("period", "1mo")
         interval = self.credentials.get("interval", "1d")
 
-        for symbol in symbols:
+        # Fetch symbols in parallel threads, capped to stay clear of Yahoo's
+        # rate limits
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch_symbol(symbol: str) -> list[DataRecord]:
             try:
-                ticker = self._yf.Ticker(symbol)
-
-                if data_type == "history":
-                    hist = ticker.history(period=period, interval=interval)
-                    for idx, row in hist.iterrows():
-                        yield DataRecord(
-                            source_id=self.source_id,
-                            source_type=self.plugin_id,
-                            timestamp=datetime.utcnow().isoformat(),
-                            data={
-                                "symbol": symbol,
-                                "date": str(idx),
-                                "open": row.get("Open"),
-                                "high": row.get("High"),
-                                "low": row.get("Low"),
-                                "close": row.get("Close"),
-                                "volume": row.get("Volume"),
-                            },
-                            metadata={"data_type": data_type},
-                        )
-
-                elif data_type == "info":
-                    info = ticker.info
-                    yield DataRecord(
-                        source_id=self.source_id,
-                        source_type=self.plugin_id,
-                        timestamp=datetime.utcnow().isoformat(),
-                        data={"symbol": symbol, **info},
-                        metadata={"data_type": data_type},
-                    )
-
-                elif data_type == "financials":
-                    for period_name, df in [("annual", ticker.financials), ("quarterly", ticker.quarterly_financials)]:
-                        if df is not None and not df.empty:
-                            for col in df.columns:
-                                record = {"symbol": symbol, "period": period_name, "date": str(col)}
-                                for idx, value in df[col].items():
-                                    record[str(idx)] = value
-                                yield DataRecord(
-                                    source_id=self.source_id,
-                                    source_type=self.plugin_id,
-                                    timestamp=datetime.utcnow().isoformat(),
-                                    data=record,
-                                    metadata={"data_type": data_type},
-                                )
-
-                elif data_type == "holders":
-                    holders = ticker.institutional_holders
-                    if holders is not None:
-                        for _, row in holders.iterrows():
-                            yield DataRecord(
-                                source_id=self.source_id,
-                                source_type=self.plugin_id,
-                                timestamp=datetime.utcnow().isoformat(),
-                                data={"symbol": symbol, **row.to_dict()},
-                                metadata={"data_type": data_type},
-                            )
-
-                elif data_type == "recommendations":
-                    recs = ticker.recommendations
-                    if recs is not None:
-                        for idx, row in recs.iterrows():
-                            yield DataRecord(
-                                source_id=self.source_id,
-                                source_type=self.plugin_id,
-                                timestamp=datetime.utcnow().isoformat(),
-                                data={"symbol": symbol, "date": str(idx), **row.to_dict()},
-                                metadata={"data_type": data_type},
-                            )
-
-            except Exception as e:
-                print(f"Yahoo Finance error for {symbol}: {e}")
+                async with semaphore:
+                    return await asyncio.to_thread(self._fetch_symbol, symbol, data_type, period, interval)
+            except Exception:
+                # One bad symbol must not abort the others
+                logger.warning("Yahoo Finance fetch failed for %s", symbol, exc_info=True)
+                return []
+
+        tasks = [asyncio.create_task(fetch_symbol(symbol)) for symbol in symbols]
+
+        try:
+            # Yield each symbol's records as soon as they are ready
+            for next_done in asyncio.as_completed(tasks):
+                for record in await next_done:
+                    yield record
+        finally:
+            # Don't leave fetches running if the consumer stops early
+            for task in tasks:
+                task.cancel()
@@ -1,28 +1,140 @@
 """Local web UI server for Fractal Connector configuration."""
 import asyncio
+import concurrent.futures
 import json
 import logging
 import secrets
 import threading
+import time
 from typing import Optional
 from pathlib import Path
 
+import orjson
 from flask import Flask, jsonify, request, render_template, send_from_directory, session, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 
 from ..core.health import health_monitor
 from ..core.queue import OfflineQueue
 
 logger = logging.getLogger(__name__)
 
-
-def create_app(engine, config_dir: Path = None) -> Flask:
-    """Create and configure the Flask application."""
+# Seconds a UI request waits on an engine call (e.g. a connection test)
+UI_CALL_TIMEOUT = 60.0
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson, keeping Flask's handling of other types."""
+
+    def _dumpb(self, obj) -> bytes:
+        # Datetimes go through Flask's default (HTTP date) as before
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dumpb(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Build the body straight from orjson's bytes
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumpb(obj) + b"\n", mimetype=self.mimetype)
+
+
+def _tail_lines(path: Path, count: int) -> list[str]:
+    """Read the last count lines of a file, reading only as much as needed from the end."""
+    with path.open('rb') as f:
+        size = f.seek(0, 2)
+        block = 16384
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            lines = f.read().splitlines()
+            # The first line read may be partial unless we began at the start
+            if start == 0 or len(lines) > count:
+                return [line.decode(errors='replace') for line in lines[-count:]]
+            block *= 2
+
+
+def _ttl_cached(func, ttl: float):
+    """Wrap a no-argument function so its result is reused for ttl seconds."""
+    lock = threading.Lock()
+    expires = 0.0
+    value = None
+
+    def wrapper():
+        nonlocal expires, value
+        with lock:
+            now = time.monotonic()
+            if now >= expires:
+                value = func()
+                expires = now + ttl
+            return value
+
+    return wrapper
+
+
+def create_app(engine, config_dir: Path = None, loop: Optional[asyncio.AbstractEventLoop] = None) -> Flask:
+    """
+    Create and configure the Flask application.
+
+    Args:
+        engine: Connector engine
+        config_dir: Directory holding the UI password file
+        loop: Event loop the engine runs on; a private background loop is
+            started if not given
+    """
     app = Flask(
         __name__,
         template_folder='templates',
         static_folder='static',
     )
 
+    # Engine coroutines are run on the engine's own loop, so data sources
+    # added from the UI keep their sync tasks running after the request
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        app.extensions['fractal_owned_loop'] = loop
+
+    def run_async(coro):
+        """Run a coroutine on the engine loop and wait up to UI_CALL_TIMEOUT for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=UI_CALL_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            # Don't pin this server thread on a hung engine call
+            future.cancel()
+            raise
+
+    @app.errorhandler(concurrent.futures.TimeoutError)
+    def handle_timeout(e):
+        return jsonify({'success': False, 'error': 'Timed out waiting for the connector engine'}), 504
+
+    # The UI polls these on every tick. Plugin schemas don't change while
+    # running; status is coalesced across bursts of polls.
+    registered_plugins = _ttl_cached(engine.get_registered_plugins, 60.0)
+    engine_status = _ttl_cached(engine.get_status, 0.5)
+
+    def cacheable(data):
+        """JSON response the browser may reuse briefly or revalidate by ETag."""
+        response = jsonify(data)
+        response.headers['Cache-Control'] = 'private, max-age=1'
+        response.add_etag()
+        return response.make_conditional(request)
+
+    app.json = ORJSONProvider(app)
+
+    # Optional: gzip/brotli-encode JSON, HTML and static text responses
+    try:
+        from flask_compress import Compress
+        Compress(app)
+    except ImportError:
+        pass
+
     # Secret key for sessions
     app.secret_key = secrets.token_hex(32)
 
@@ -100,7 +212,8 @@ def create_app(engine, config_dir: Path = None) -> Flask:
     @app.route('/static/<path:filename>')
     def serve_static(filename):
         """Serve static files."""
-        return send_from_directory(app.static_folder, filename)
+        # Let the browser reuse assets for a day instead of refetching per page
+        return send_from_directory(app.static_folder, filename, max_age=86400)
 
     # ==================== HEALTH ROUTES ====================
 
@@ -128,14 +241,14 @@ def create_app(engine, config_dir: Path = None) -> Flask:
         """Get current connector status."""
         if not check_auth():
             return jsonify({'error': 'Unauthorized'}), 401
-        return jsonify(engine.get_status())
+        return cacheable(engine_status())
 
     @app.route('/api/plugins')
     def get_plugins():
         """Get list of available plugins with credential fields."""
         if not check_auth():
             return jsonify({'error': 'Unauthorized'}), 401
-        return jsonify(engine.get_registered_plugins())
+        return cacheable(registered_plugins())
 
     @app.route('/api/sources')
     def get_sources():
@@ -168,13 +281,7 @@ def create_app(engine, config_dir: Path = None) -> Flask:
         if not plugin_type or not name:
             return jsonify({'success': False, 'error': 'Missing plugin_type or name'}), 400
 
-        loop = asyncio.new_event_loop()
-        try:
-            success, result = loop.run_until_complete(
-                engine.add_data_source(plugin_type, name, credentials)
-            )
-        finally:
-            loop.close()
+        success, result = run_async(engine.add_data_source(plugin_type, name, credentials))
 
         if success:
             return jsonify({'success': True, 'source_id': result})
@@ -187,11 +294,7 @@ def create_app(engine, config_dir: Path = None) -> Flask:
         if not check_auth():
             return jsonify({'error': 'Unauthorized'}), 401
 
-        loop = asyncio.new_event_loop()
-        try:
-            success = loop.run_until_complete(engine.remove_data_source(source_id))
-        finally:
-            loop.close()
+        success = run_async(engine.remove_data_source(source_id))
 
         return jsonify({'success': success})
 
@@ -208,13 +311,7 @@ def create_app(engine, config_dir: Path = None) -> Flask:
         if not plugin_type:
             return jsonify({'success': False, 'error': 'Missing plugin_type'}), 400
 
-        loop = asyncio.new_event_loop()
-        try:
-            success, message = loop.run_until_complete(
-                engine.test_data_source(plugin_type, credentials)
-            )
-        finally:
-            loop.close()
+        success, message = run_async(engine.test_data_source(plugin_type, credentials))
 
         return jsonify({'success': success, 'message': message})
 
@@ -269,7 +366,7 @@ def create_app(engine, config_dir: Path = None) -> Flask:
             log_file = get_log_dir() / 'fractal-connector.log'
 
             if log_file.exists():
-                lines = log_file.read_text().split('\n')[-100:]  # Last 100 lines
+                lines = _tail_lines(log_file, 100)  # Last 100 lines
                 return jsonify({'logs': lines})
             else:
                 return jsonify({'logs': []})
@@ -288,22 +385,37 @@ class UIServer:
         self.port = port
         self.config_dir = config_dir or engine.config.config_dir
         self._app: Optional[Flask] = None
+        self._server = None
         self._thread: Optional[threading.Thread] = None
 
     def start(self):
         """Start the web UI server in a background thread."""
-        self._app = create_app(self.engine, self.config_dir)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self._app = create_app(self.engine, self.config_dir, loop)
 
         def run_server():
-            log = logging.getLogger('werkzeug')
-            log.setLevel(logging.WARNING)
-
-            self._app.run(
-                host=self.host,
-                port=self.port,
-                debug=False,
-                use_reloader=False,
-            )
+            try:
+                from waitress import create_server
+            except ImportError:
+                # Fall back to Werkzeug's development server
+                log = logging.getLogger('werkzeug')
+                log.setLevel(logging.WARNING)
+
+                self._app.run(
+                    host=self.host,
+                    port=self.port,
+                    debug=False,
+                    use_reloader=False,
+                )
+                return
+
+            # Several worker threads, so health probes and static files aren't
+            # stuck behind a slow API call such as a connection test
+            self._server = create_server(self._app, host=self.host, port=self.port, threads=8)
+            self._server.run()
 
         self._thread = threading.Thread(target=run_server, daemon=True)
         self._thread.start()
@@ -312,7 +424,13 @@ class UIServer:
 
     def stop(self):
         """Stop the web UI server."""
-        pass
+        if self._server:
+            self._server.close()
+            self._server = None
+        if self._app:
+            loop = self._app.extensions.get('fractal_owned_loop')
+            if loop:
+                loop.call_soon_threadsafe(loop.stop)
 
     @property
     def url(self) -> str:
@@ -0,0 +1,45 @@
+"""Tests that iter_csv_rows returns what pandas.read_csv would."""
+import io
+import math
+
+import pandas as pd
+import pytest
+
+from src.plugins._csv import iter_csv_rows
+
+
+def normalized(rows: list[dict]) -> list[list[tuple]]:
+    """Rows as (key, type, value) triples, with NaN made comparable."""
+    return [
+        [(k, type(v), "NaN" if isinstance(v, float) and math.isnan(v) else v) for k, v in row.items()]
+        for row in rows
+    ]
+
+
+def assert_matches_pandas(text: str, delimiter: str = ",", columns: list[str] | None = None, chunksize: int = 2):
+    expected = pd.read_csv(io.BytesIO(text.encode()), delimiter=delimiter, usecols=columns).to_dict(orient='records')
+    chunks = list(iter_csv_rows(io.BytesIO(text.encode()), delimiter, chunksize, columns))
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    assert normalized([row for chunk in chunks for row in chunk]) == normalized(expected)
+
+
+@pytest.mark.parametrize("text", [
+    pytest.param("flag,n\nTrue,1\nFalse,2\nTrue,3\n", id="booleans"),
+    pytest.param("a,b\n 1,x\n2 ,y\n", id="padded-numbers"),
+    pytest.param("a,b\n1,\n,y\n3,z\n", id="empty-cells"),
+    pytest.param("a,b\n0.0,x\n1.5,y\n0,z\n7,w\n", id="types-across-chunks"),
+    pytest.param("a,a,b\n1,2,3\n4,5,6\n", id="duplicate-header"),
+    pytest.param("when,n\n2024-01-02 03:04:05,1\n", id="timestamps-as-text"),
+])
+def test_matches_pandas(text):
+    assert_matches_pandas(text)
+
+
+def test_types_are_consistent_across_chunks():
+    rows = [row for chunk in iter_csv_rows(io.BytesIO(b"a\n0.0\n1\n2\n"), chunksize=1) for row in chunk]
+
+    assert [type(row["a"]) for row in rows] == [float, float, float]
+
+
+def test_selected_columns_and_delimiter():
+    assert_matches_pandas("a;b;c\n1;x;2.5\n3;y;\n", delimiter=";", columns=["c", "a"])
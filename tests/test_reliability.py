@@ -0,0 +1,197 @@
+"""Tests for the circuit breaker and request_with_retry."""
+import asyncio
+
+import aiohttp
+import pytest
+
+from src.plugins import _reliability
+from src.plugins._reliability import CircuitBreaker, CircuitOpenError, request_with_retry
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.released = True
+
+
+class FakeSession:
+    """Session whose request() plays back a script of statuses and exceptions."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    async def request(self, method, url, **kwargs):
+        self.calls += 1
+        step = self.script.pop(0)
+        if isinstance(step, BaseException):
+            raise step
+        if step == "hang":
+            await asyncio.Event().wait()
+        return FakeResponse(step)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(_reliability.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers(monkeypatch):
+    monkeypatch.setattr(_reliability, "_breakers", {})
+
+
+def open_breaker(breaker: CircuitBreaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_breaker_ignores_failures_outside_window(clock):
+    breaker = CircuitBreaker(failure_threshold=3, window=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 31
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_a_single_trial(clock):
+    breaker = CircuitBreaker(reset_timeout=30.0)
+    open_breaker(breaker)
+    clock.now += 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = CircuitBreaker()
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = CircuitBreaker()
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request()
+
+
+def test_retries_retryable_status_then_succeeds(clock):
+    session = FakeSession(503, 200)
+
+    async def run():
+        async with request_with_retry(session, "GET", "http://host/x", base_delay=0) as response:
+            return response.status
+
+    assert asyncio.run(run()) == 200
+    assert session.calls == 2
+    assert _reliability.get_breaker("host").state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_rejects_without_sending(clock):
+    open_breaker(_reliability.get_breaker("host"))
+    session = FakeSession(200)
+
+    async def run():
+        async with request_with_retry(session, "GET", "http://host/x"):
+            pass
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(run())
+    assert session.calls == 0
+
+
+def test_non_retryable_error_settles_half_open_trial(clock):
+    breaker = _reliability.get_breaker("host")
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+    session = FakeSession(aiohttp.TooManyRedirects(None, ()))
+
+    async def run():
+        async with request_with_retry(session, "GET", "http://host/x"):
+            pass
+
+    with pytest.raises(aiohttp.TooManyRedirects):
+        asyncio.run(run())
+    assert session.calls == 1
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request()
+
+
+def test_cancelled_trial_is_released(clock):
+    breaker = _reliability.get_breaker("host")
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+
+    session = FakeSession("hang")
+
+    async def run():
+        async def send():
+            async with request_with_retry(session, "GET", "http://host/x"):
+                pass
+
+        task = asyncio.create_task(send())
+        while not session.calls:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_bulkhead_held_until_block_exits(clock):
+    async def run():
+        async with request_with_retry(FakeSession(200), "GET", "http://host/x") as response:
+            held = _reliability._get_bulkhead("host")._value
+        return held, _reliability._get_bulkhead("host")._value, response.released
+
+    held, after, released = asyncio.run(run())
+    assert held == _reliability.BULKHEAD_SIZE - 1
+    assert after == _reliability.BULKHEAD_SIZE
+    assert released
@@ -0,0 +1,52 @@
+"""Tests for RESTPlugin response parsing."""
+import asyncio
+
+from src.plugins import rest_plugin
+from src.plugins.rest_plugin import RESTPlugin
+
+
+class FakeResponse:
+    """Async context manager standing in for an aiohttp response."""
+
+    status = 200
+    reason = "OK"
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def fetch_all(body: bytes, monkeypatch) -> list:
+    def fake_request(session, method, url, **kwargs):
+        return FakeResponse(body)
+
+    monkeypatch.setattr(rest_plugin, "request_with_retry", fake_request)
+    plugin = RESTPlugin("test", {"base_url": "https://api.example.com", "endpoint": "/v1/data"})
+
+    async def collect():
+        return [record async for record in plugin.fetch_data()]
+
+    return asyncio.run(collect())
+
+
+def test_fetch_data_top_level_array_carries_total(monkeypatch):
+    records = fetch_all(b' [{"a": 1}, {"a": 2}, 3]', monkeypatch)
+
+    assert [r.data for r in records] == [{"a": 1}, {"a": 2}, {"value": 3}]
+    assert [r.metadata["index"] for r in records] == [0, 1, 2]
+    assert [r.metadata["total"] for r in records] == [3, 3, 3]
+
+
+def test_fetch_data_unwraps_nested_list(monkeypatch):
+    records = fetch_all(b'{"data": [{"a": 1}, {"a": 2}]}', monkeypatch)
+
+    assert [r.data for r in records] == [{"a": 1}, {"a": 2}]
+    assert records[0].metadata["total"] == 2
@@ -0,0 +1,70 @@
+"""Tests for SFTPPlugin file downloads."""
+import asyncio
+
+from src.plugins.sftp_plugin import SFTPPlugin
+
+
+class FakeFile:
+    def __init__(self, client, content: bytes):
+        self._client = client
+        self._content = content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self) -> bytes:
+        await asyncio.sleep(0)
+        self._client.held += 1
+        self._client.max_held = max(self._client.max_held, self._client.held)
+        return self._content
+
+
+class FakeSFTPClient:
+    """asyncssh SFTPClient stand-in counting files downloaded but not yet emitted."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = files
+        self.held = 0
+        self.max_held = 0
+
+    async def listdir(self, path: str) -> list[str]:
+        return [".", "..", *self.files]
+
+    def open(self, path: str, mode: str, **kwargs) -> FakeFile:
+        return FakeFile(self, self.files[path.rsplit("/", 1)[1]])
+
+
+def fetch_all(files: dict[str, bytes], concurrency: int) -> tuple[list, FakeSFTPClient]:
+    plugin = SFTPPlugin("test", {"remote_path": "/data", "concurrency": concurrency})
+    client = plugin._sftp = FakeSFTPClient(files)
+
+    async def collect():
+        records = []
+        async for record in plugin.fetch_data():
+            records.append(record)
+            if record.metadata["row_index"] == record.metadata["total_rows"] - 1:
+                # The file's records have all been emitted
+                client.held -= 1
+        return records
+
+    return asyncio.run(collect()), client
+
+
+def test_files_held_in_memory_are_bounded():
+    files = {f"f{i}.csv": f"a,b\n{i},x\n{i},y\n".encode() for i in range(6)}
+    records, client = fetch_all(files, concurrency=2)
+
+    assert len(records) == 12
+    assert client.max_held <= 2
+    assert {r.metadata["total_rows"] for r in records} == {2}
+    assert [r.metadata["row_index"] for r in records if r.metadata["file"] == "f0.csv"] == [0, 1]
+
+
+def test_unparseable_file_is_skipped():
+    files = {"good.csv": b"a\n1\n", "bad.csv": b'a\n"unterminated\n'}
+    records, _ = fetch_all(files, concurrency=4)
+
+    assert [(r.metadata["file"], r.data) for r in records] == [("good.csv", {"a": 1})]